@@ -0,0 +1,42 @@
+"""Helpers shared by the FlowerPower skill scripts."""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+
+
+def resolve_project_dir(base_dir: Path | str | None = None) -> str:
+    """Return the absolute project path used as the ``load_project`` cache key."""
+    return str(Path(base_dir or ".").resolve())
+
+
+@functools.lru_cache(maxsize=8)
+def load_project(project_dir: str):
+    """Load a FlowerPower project, reusing it across calls in this process.
+
+    Pass ``project_dir`` through ``resolve_project_dir`` so relative and
+    absolute paths share a cache entry. Long-lived processes that edit project
+    files should call ``load_project.cache_clear()``.
+    """
+    from flowerpower import FlowerPowerProject
+
+    return FlowerPowerProject.load(project_dir)
+
+
+def resolve_use_cli(requested: bool) -> bool:
+    """Decide between the CLI and the Python API.
+
+    Falls back to the CLI when flowerpower isn't importable by this
+    interpreter, e.g. when it was installed with pipx or ``uv tool``.
+    """
+    import importlib.util
+
+    if requested or importlib.util.find_spec("flowerpower") is not None:
+        return requested
+    print(
+        "flowerpower is not importable here; using the flowerpower CLI instead",
+        file=sys.stderr,
+    )
+    return True
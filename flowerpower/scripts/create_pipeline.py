@@ -1,33 +1,41 @@
 #!/usr/bin/env python3
-"""Create a new FlowerPower pipeline.
+"""Create one or more new FlowerPower pipelines.
 
 Usage:
-    python create_pipeline.py <pipeline_name> [--path <project_dir>] [--overwrite]
+    python create_pipeline.py <pipeline_name> [<pipeline_name> ...] [--path <project_dir>] [--overwrite]
 
 Examples:
     python create_pipeline.py data_ingestion
+    python create_pipeline.py ingest transform export
     python create_pipeline.py etl_process --path /projects/my-project
     python create_pipeline.py analytics --overwrite
 """
 
+from __future__ import annotations
+
 import argparse
-import subprocess
+import functools
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
+from string import Template
+from typing import Callable
+
+from _common import load_project, resolve_project_dir, resolve_use_cli
 
 
-PIPELINE_TEMPLATE = '''# FlowerPower pipeline {name}
-# Created on {date}
+PIPELINE_TEMPLATE = '''# FlowerPower pipeline $name
+# Created on $date
 
 from pathlib import Path
 from hamilton.function_modifiers import parameterize
 
 from flowerpower.cfg import Config
 
-# Load pipeline parameters from conf/pipelines/{name}.yml
+# Load pipeline parameters from conf/pipelines/$name.yml
 PARAMS = Config.load(
-    Path(__file__).parents[1], pipeline_name="{name}"
+    Path(__file__).parents[1], pipeline_name="$name"
 ).pipeline.h_params
 
 
@@ -39,7 +47,7 @@ def _validate_data(data: dict) -> bool:
 
 # Pipeline functions (each becomes a node in the DAG)
 
-@parameterize(**PARAMS.get("input_config", {{"source": "default"}}))
+@parameterize(**PARAMS.get("input_config", {"source": "default"}))
 def load_data(source: str) -> dict:
     """Load data from source.
     
@@ -50,7 +58,7 @@ def load_data(source: str) -> dict:
         Loaded data dictionary
     """
     # TODO: Implement data loading logic
-    return {{"source": source, "data": []}}
+    return {"source": source, "data": []}
 
 
 def validate_data(load_data: dict) -> dict:
@@ -77,7 +85,7 @@ def process_data(validate_data: dict) -> dict:
         Processed data
     """
     # TODO: Implement processing logic
-    return {{"processed": True, **validate_data}}
+    return {"processed": True, **validate_data}
 
 
 def final_output(process_data: dict) -> str:
@@ -89,11 +97,11 @@ def final_output(process_data: dict) -> str:
     Returns:
         Output summary string
     """
-    return f"Processed {{len(process_data)}} items"
+    return f"Processed {len(process_data)} items"
 '''
 
 
-CONFIG_TEMPLATE = """# Pipeline configuration for {name}
+CONFIG_TEMPLATE = """# Pipeline configuration for $name
 # See references/configuration.md for all options
 
 params:
@@ -121,11 +129,86 @@ run:
 """
 
 
+def _compile_template(template: str):
+    """Compile a ``string.Template`` source into a rendering function.
+
+    The placeholders become the function's parameters and the body is a
+    single f-string, so rendering does no template parsing at all.
+    """
+    parts = []
+    names = []
+    pos = 0
+
+    for m in Template.pattern.finditer(template):
+        literal = template[pos : m.start()]
+        if m.group("escaped") is not None:
+            literal += "$"
+        elif m.group("invalid") is not None:
+            raise ValueError(f"Invalid placeholder in template at offset {m.start()}")
+        if literal:
+            # repr() never emits braces of its own, so doubling them is safe
+            parts.append("f" + repr(literal).replace("{", "{{").replace("}", "}}"))
+        name = m.group("named") or m.group("braced")
+        if name is not None:
+            parts.append(f"f'{{{name}}}'")
+            if name not in names:
+                names.append(name)
+        pos = m.end()
+
+    if pos < len(template):
+        literal = template[pos:]
+        parts.append("f" + repr(literal).replace("{", "{{").replace("}", "}}"))
+
+    return eval(f"lambda {', '.join(names)}: {' '.join(parts) or repr('')}")
+
+
+# Compiled once at import; rendering is a single f-string evaluation per call.
+_render_pipeline = _compile_template(PIPELINE_TEMPLATE)
+_render_config = _compile_template(CONFIG_TEMPLATE)
+
+
+def _fmt_now(now=datetime.now) -> str:
+    """Return the current local time as ``YYYY-MM-DD HH:MM:SS``."""
+    d = now()
+    return (
+        f"{d.year:04d}-{d.month:02d}-{d.day:02d} "
+        f"{d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+    )
+
+
+def _write_file(path: Path, content: str, overwrite: bool) -> None:
+    """Write ``content`` to ``path``, creating parent directories on demand.
+
+    Uses a raw file descriptor; the files are small enough that Python's
+    buffered text layer only adds overhead.
+
+    Raises:
+        FileExistsError: If ``path`` exists and ``overwrite`` is False
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if not overwrite:
+        flags |= os.O_EXCL
+    # The directories almost always exist already, so skip any stat/mkdir
+    # up front and only create them if the open fails
+    try:
+        fd = os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, flags, 0o666)
+
+    data = memoryview(content.encode("utf-8"))
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
 def create_pipeline(
     name: str,
-    project_path: Path | None = None,
+    project_path: Path | str | None = None,
     overwrite: bool = False,
-    use_cli: bool = True,
+    use_cli: bool = False,
 ) -> tuple[Path, Path]:
     """Create a new pipeline.
 
@@ -133,14 +216,17 @@ def create_pipeline(
         name: Pipeline name
         project_path: Path to FlowerPower project
         overwrite: Overwrite existing pipeline
-        use_cli: Use CLI instead of Python API
+        use_cli: Run the ``flowerpower`` CLI in a subprocess instead of
+            the in-process Python API
 
     Returns:
         Tuple of (module_path, config_path)
     """
-    base_dir = project_path or Path.cwd()
+    base_dir = Path(project_path) if project_path else Path.cwd()
 
     if use_cli:
+        import subprocess
+
         cmd = ["flowerpower", "pipeline", "new", name]
         if overwrite:
             cmd.append("--overwrite")
@@ -149,9 +235,7 @@ def create_pipeline(
         module_path = base_dir / "pipelines" / f"{name}.py"
         config_path = base_dir / "conf" / "pipelines" / f"{name}.yml"
     else:
-        from flowerpower import FlowerPowerProject
-
-        project = FlowerPowerProject.load(str(base_dir))
+        project = load_project(resolve_project_dir(base_dir))
         project.pipeline_manager.new(name=name, overwrite=overwrite)
 
         module_path = base_dir / "pipelines" / f"{name}.py"
@@ -161,7 +245,7 @@ def create_pipeline(
 
 
 def create_pipeline_from_template(
-    name: str, project_path: Path | None = None, overwrite: bool = False
+    name: str, project_path: Path | str | None = None, overwrite: bool = False
 ) -> tuple[Path, Path]:
     """Create pipeline using templates (no CLI dependency).
 
@@ -173,7 +257,7 @@ def create_pipeline_from_template(
     Returns:
         Tuple of (module_path, config_path)
     """
-    base_dir = project_path or Path.cwd()
+    base_dir = Path(project_path) if project_path else Path.cwd()
 
     pipelines_dir = base_dir / "pipelines"
     config_dir = base_dir / "conf" / "pipelines"
@@ -181,38 +265,116 @@ def create_pipeline_from_template(
     module_path = pipelines_dir / f"{name}.py"
     config_path = config_dir / f"{name}.yml"
 
-    # Check existing
-    if not overwrite:
-        if module_path.exists():
-            raise FileExistsError(f"Pipeline module already exists: {module_path}")
-        if config_path.exists():
-            raise FileExistsError(f"Pipeline config already exists: {config_path}")
+    date_str = _fmt_now()
 
-    # Create directories
-    pipelines_dir.mkdir(parents=True, exist_ok=True)
-    config_dir.mkdir(parents=True, exist_ok=True)
+    module_content = _render_pipeline(name=name, date=date_str)
+    config_content = _render_config(name=name)
 
-    # Write files
-    date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Let os.open() do the existence check (O_EXCL) instead of stat-ing first
+    try:
+        _write_file(module_path, module_content, overwrite)
+    except FileExistsError:
+        raise FileExistsError(
+            f"Pipeline module already exists: {module_path}"
+        ) from None
+    try:
+        _write_file(config_path, config_content, overwrite)
+    except FileExistsError:
+        # Don't leave a half-created pipeline behind
+        module_path.unlink()
+        raise FileExistsError(
+            f"Pipeline config already exists: {config_path}"
+        ) from None
 
-    module_content = PIPELINE_TEMPLATE.format(name=name, date=date_str)
-    config_content = CONFIG_TEMPLATE.format(name=name)
+    return module_path, config_path
 
-    module_path.write_text(module_content)
-    config_path.write_text(config_content)
 
-    return module_path, config_path
+def create_pipelines(
+    names: list[str],
+    project_path: Path | str | None = None,
+    overwrite: bool = False,
+    template_only: bool = False,
+    use_cli: bool = False,
+    on_created: Callable[[str, Path, Path], None] | None = None,
+) -> list[tuple[Path, Path]]:
+    """Create several pipelines, loading the project only once.
 
+    Pipelines are created in order; duplicate names are created once. If one
+    fails, the ones before it are kept and the error is raised.
 
-def main():
-    parser = argparse.ArgumentParser(description="Create a new FlowerPower pipeline")
+    Args:
+        names: Pipeline names
+        project_path: Path to FlowerPower project
+        overwrite: Overwrite existing pipelines
+        template_only: Use templates instead of flowerpower
+        use_cli: Run the ``flowerpower`` CLI in a subprocess per pipeline
+        on_created: Called with (name, module_path, config_path) as soon as
+            each pipeline has been created
+
+    Returns:
+        List of (module_path, config_path) tuples, in the order of ``names``
+    """
+    base_dir = Path(project_path) if project_path else Path.cwd()
+
+    if template_only:
+        create = functools.partial(
+            create_pipeline_from_template, project_path=base_dir, overwrite=overwrite
+        )
+    elif use_cli:
+        create = functools.partial(
+            create_pipeline, project_path=base_dir, overwrite=overwrite, use_cli=True
+        )
+    else:
+        project = load_project(resolve_project_dir(base_dir))
+
+        def create(name: str) -> tuple[Path, Path]:
+            project.pipeline_manager.new(name=name, overwrite=overwrite)
+            return (
+                base_dir / "pipelines" / f"{name}.py",
+                base_dir / "conf" / "pipelines" / f"{name}.yml",
+            )
+
+    paths = []
+
+    for name in dict.fromkeys(names):
+        module_path, config_path = create(name)
+        paths.append((module_path, config_path))
+        if on_created is not None:
+            on_created(name, module_path, config_path)
+
+    return paths
+
+
+def _report_created(name: str, module_path: Path, config_path: Path) -> None:
+    print(f"\nPipeline created:")
+    print(f"  Module: {module_path}")
+    print(f"  Config: {config_path}")
+    print("\nNext steps:")
+    print(f"  1. Edit {module_path} to implement pipeline logic")
+    print(f"  2. Configure parameters in {config_path}")
+    print(f"  3. Run: flowerpower pipeline run {name}")
+
+
+def _report_remaining(names: list[str], created: list[str]) -> None:
+    if not created:
+        return
+    remaining = names[len(created) :]
+    print(f"Created before the error: {' '.join(created)}")
+    print(f"Not created: {' '.join(remaining)}")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Create new FlowerPower pipelines")
     parser.add_argument(
-        "name", help="Pipeline name (use underscores, e.g., my_pipeline)"
+        "names",
+        nargs="+",
+        metavar="name",
+        help="Pipeline name(s) (use underscores, e.g., my_pipeline)",
     )
     parser.add_argument(
         "--path",
         "-p",
-        type=Path,
         help="Path to FlowerPower project (default: current directory)",
     )
     parser.add_argument(
@@ -223,39 +385,55 @@ def main():
         action="store_true",
         help="Use templates instead of CLI (no flowerpower installation required)",
     )
+    parser.add_argument(
+        "--use-cli",
+        action="store_true",
+        help="Use the flowerpower CLI in a subprocess instead of the Python API",
+    )
 
-    args = parser.parse_args()
+    return parser
 
-    # Validate name
-    if "-" in args.name:
-        print(f"Warning: Pipeline names should use underscores, not hyphens")
-        args.name = args.name.replace("-", "_")
-        print(f"Using: {args.name}")
 
-    try:
-        if args.template_only:
-            module_path, config_path = create_pipeline_from_template(
-                args.name, args.path, args.overwrite
-            )
-        else:
-            module_path, config_path = create_pipeline(
-                args.name, args.path, args.overwrite
-            )
+def main():
+    args = _build_parser().parse_args()
+
+    # Validate names
+    names = []
+    for name in args.names:
+        if "-" in name:
+            print(f"Warning: Pipeline names should use underscores, not hyphens")
+            name = name.replace("-", "_")
+            print(f"Using: {name}")
+        names.append(name)
+
+    # create_pipelines() skips repeated names; _report_remaining needs the
+    # same de-duplicated order to tell which names were not created
+    unique_names = list(dict.fromkeys(names))
+    created = []
+
+    def report(name: str, module_path: Path, config_path: Path) -> None:
+        created.append(name)
+        _report_created(name, module_path, config_path)
 
-        print(f"\nPipeline created:")
-        print(f"  Module: {module_path}")
-        print(f"  Config: {config_path}")
-        print("\nNext steps:")
-        print(f"  1. Edit {module_path} to implement pipeline logic")
-        print(f"  2. Configure parameters in {config_path}")
-        print(f"  3. Run: flowerpower pipeline run {args.name}")
+    try:
+        create_pipelines(
+            names,
+            args.path,
+            args.overwrite,
+            template_only=args.template_only,
+            use_cli=not args.template_only and resolve_use_cli(args.use_cli),
+            on_created=report,
+        )
 
     except FileExistsError as e:
         print(f"Error: {e}")
         print("Use --overwrite to replace existing pipeline")
+        _report_remaining(unique_names, created)
         sys.exit(1)
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
+        # Also covers subprocess.CalledProcessError from the --use-cli path
         print(f"Error creating pipeline: {e}")
+        _report_remaining(unique_names, created)
         sys.exit(1)
 
 
@@ -10,47 +10,120 @@ Examples:
     python init_project.py etl-pipeline --with-io
 """
 
+from __future__ import annotations
+
 import argparse
-import subprocess
+import functools
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def check_flowerpower_installed() -> bool:
-    """Check if flowerpower is installed."""
-    try:
-        import flowerpower
+    """Check if flowerpower is installed (without importing it)."""
+    import importlib.util
+
+    return importlib.util.find_spec("flowerpower") is not None
+
+
+def _extras_installed(extras: list[str]) -> bool:
+    """Check whether the requirements of flowerpower ``extras`` are installed.
+
+    Only the presence of each requirement is checked, not its version.
+    """
+    import re
+    from importlib import metadata
 
-        return True
-    except ImportError:
+    try:
+        requires = metadata.distribution("flowerpower").requires or []
+    except metadata.PackageNotFoundError:
         return False
 
+    for extra in extras:
+        marker = re.compile(rf"""extra\s*==\s*["']{re.escape(extra)}["']""")
+        reqs = [
+            req
+            for req, _, env in (r.partition(";") for r in requires)
+            if marker.search(env)
+        ]
+        if not reqs:
+            return False
+
+        for req in reqs:
+            dist = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?", req)
+            if dist is None:
+                return False
+            dist_name, dist_extras = dist.groups()
+            # Extras such as "all" may be defined as flowerpower[io,ui]
+            if dist_name.lower() == "flowerpower":
+                if dist_extras and not _extras_installed(
+                    [e.strip() for e in dist_extras.split(",")]
+                ):
+                    return False
+                continue
+            try:
+                metadata.distribution(dist_name)
+            except metadata.PackageNotFoundError:
+                return False
+
+    return True
+
 
 def install_flowerpower(extras: list[str] | None = None) -> None:
-    """Install flowerpower with optional extras."""
+    """Install flowerpower with optional extras.
+
+    Does nothing if flowerpower and the requested extras are already installed.
+    """
+    if check_flowerpower_installed() and _extras_installed(extras or []):
+        return
+
     package = "flowerpower"
     if extras:
         package = f"flowerpower[{','.join(extras)}]"
 
+    import subprocess
+
     print(f"Installing {package}...")
-    subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "--quiet",
+            package,
+        ],
+        check=True,
+    )
+    # Make the new package visible to this process's import system
+    import importlib
+
+    importlib.invalidate_caches()
+    check_flowerpower_installed.cache_clear()
 
 
-def init_project(name: str, path: Path | None = None, use_cli: bool = True) -> Path:
+def init_project(
+    name: str, path: Path | str | None = None, use_cli: bool = False
+) -> Path:
     """Initialize a new FlowerPower project.
 
     Args:
         name: Project name
         path: Directory to create project in (default: current directory)
-        use_cli: Use CLI instead of Python API
+        use_cli: Run the ``flowerpower`` CLI in a subprocess instead of
+            the in-process Python API
 
     Returns:
         Path to created project
     """
-    base_dir = path or Path.cwd()
+    base_dir = Path(path) if path else Path.cwd()
     project_path = base_dir / name
 
     if use_cli:
+        import subprocess
+
         cmd = ["flowerpower", "init", "--name", name]
         if path:
             cmd.extend(["--base-dir", str(path)])
@@ -63,13 +136,13 @@ def init_project(name: str, path: Path | None = None, use_cli: bool = True) -> P
     return project_path
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Initialize a new FlowerPower project")
     parser.add_argument("name", help="Project name")
     parser.add_argument(
         "--path",
         "-p",
-        type=Path,
         help="Directory to create project in (default: current directory)",
     )
     parser.add_argument(
@@ -83,8 +156,17 @@ def main():
     parser.add_argument(
         "--with-all", action="store_true", help="Install with all optional dependencies"
     )
+    parser.add_argument(
+        "--use-cli",
+        action="store_true",
+        help="Use the flowerpower CLI in a subprocess instead of the Python API",
+    )
+
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     # Determine extras to install
     extras = []
@@ -97,13 +179,10 @@ def main():
             extras.append("ui")
 
     # Install if needed
-    if not check_flowerpower_installed():
-        install_flowerpower(extras if extras else None)
-    elif extras:
-        install_flowerpower(extras)
+    install_flowerpower(extras if extras else None)
 
     # Initialize project
-    project_path = init_project(args.name, args.path)
+    project_path = init_project(args.name, args.path, use_cli=args.use_cli)
 
     print(f"\nProject initialized: {project_path}")
     print("\nNext steps:")
@@ -10,15 +10,20 @@ Examples:
     python list_pipelines.py --format json
 """
 
+from __future__ import annotations
+
 import argparse
-import json
-import subprocess
+import functools
+import os
 import sys
+import time
 from pathlib import Path
 
+from _common import load_project, resolve_project_dir, resolve_use_cli
+
 
 def list_pipelines_cli(
-    base_dir: Path | None = None, output_format: str = "table"
+    base_dir: Path | str | None = None, output_format: str = "table"
 ) -> None:
     """List pipelines using CLI.
 
@@ -26,6 +31,8 @@ def list_pipelines_cli(
         base_dir: Project directory
         output_format: Output format (table, json, yaml)
     """
+    import subprocess
+
     cmd = ["flowerpower", "pipeline", "show-pipelines"]
 
     if base_dir:
@@ -36,7 +43,7 @@ def list_pipelines_cli(
     subprocess.run(cmd, check=True)
 
 
-def list_pipelines_api(base_dir: Path | None = None) -> list[str]:
+def list_pipelines_api(base_dir: Path | str | None = None) -> list[str]:
     """List pipelines using Python API.
 
     Args:
@@ -45,52 +52,120 @@ def list_pipelines_api(base_dir: Path | None = None) -> list[str]:
     Returns:
         List of pipeline names
     """
-    from flowerpower import FlowerPowerProject
-
-    project = FlowerPowerProject.load(str(base_dir) if base_dir else ".")
+    project = load_project(resolve_project_dir(base_dir))
     return project.pipeline_manager.list()
 
 
-def list_pipelines_filesystem(base_dir: Path | None = None) -> list[dict]:
+# Coarsest common mtime resolution (FAT); newer mtimes are not trusted
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# (pipelines dir as given, absolute) -> ((dir mtimes), pipelines)
+_scan_cache: dict[tuple[str, str], tuple[tuple[int, int | None], list[dict]]] = {}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def list_pipelines_filesystem(base_dir: Path | str | None = None) -> list[dict]:
     """List pipelines by scanning filesystem (no flowerpower required).
 
+    Results are cached per directory and reused while neither the pipelines
+    nor the config directory mtime changes.
+
     Args:
         base_dir: Project directory
 
     Returns:
         List of pipeline info dicts
     """
-    project_dir = base_dir or Path.cwd()
+    project_dir = Path(base_dir) if base_dir else Path.cwd()
     pipelines_dir = project_dir / "pipelines"
     config_dir = project_dir / "conf" / "pipelines"
 
-    if not pipelines_dir.exists():
+    pipelines_mtime = _mtime_ns(pipelines_dir)
+    if pipelines_mtime is None:
         return []
 
-    pipelines = []
+    # Adding or removing a file bumps its directory's mtime
+    stamp = (pipelines_mtime, _mtime_ns(config_dir))
+    key = (str(pipelines_dir), str(pipelines_dir.absolute()))
+    cached = _scan_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return [dict(p) for p in cached[1]]
+
+    pipelines = _scan_pipelines(pipelines_dir, config_dir)
 
-    for module_file in pipelines_dir.glob("*.py"):
-        if module_file.name.startswith("_"):
-            continue
+    # Racy-stat rule: a change made within the same mtime tick as this scan
+    # would not bump the stamp, so only cache once both mtimes are settled
+    settled = time.time_ns() - _MTIME_GRANULARITY_NS
+    if all(m is None or m < settled for m in stamp):
+        _scan_cache[key] = (stamp, [dict(p) for p in pipelines])
+    else:
+        _scan_cache.pop(key, None)
+    return pipelines
 
-        name = module_file.stem
-        config_file = config_dir / f"{name}.yml"
+
+def _scan_pipelines(pipelines_dir: Path, config_dir: Path) -> list[dict]:
+    try:
+        with os.scandir(pipelines_dir) as it:
+            names = [
+                e.name[:-3]
+                for e in it
+                if e.name.endswith(".py")
+                and not e.name.startswith("_")
+                and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    # One directory scan instead of an exists() check per pipeline
+    try:
+        with os.scandir(config_dir) as it:
+            config_names = {e.name for e in it if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        config_names = set()
+
+    pipelines = []
+
+    for name in names:
+        config_name = f"{name}.yml"
+        has_config = config_name in config_names
 
         pipelines.append(
             {
                 "name": name,
-                "module": str(module_file),
-                "config": str(config_file) if config_file.exists() else None,
-                "has_config": config_file.exists(),
+                "module": str(pipelines_dir / f"{name}.py"),
+                "config": str(config_dir / config_name) if has_config else None,
+                "has_config": has_config,
             }
         )
 
     return sorted(pipelines, key=lambda p: p["name"])
 
 
-def main():
+def _write_json(data) -> None:
+    """Stream ``data`` to stdout as JSON (pretty on a terminal, compact when piped)."""
+    import json
+
+    json.dump(data, sys.stdout, indent=2 if sys.stdout.isatty() else None)
+    sys.stdout.write("\n")
+
+
+def _write_lines(lines) -> None:
+    """Write ``lines`` to stdout in a single call."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="List available FlowerPower pipelines")
-    parser.add_argument("--path", "-p", type=Path, help="Path to FlowerPower project")
+    parser.add_argument("--path", "-p", help="Path to FlowerPower project")
     parser.add_argument(
         "--format",
         "-f",
@@ -99,7 +174,14 @@ def main():
         help="Output format",
     )
     parser.add_argument(
-        "--use-api", action="store_true", help="Use Python API instead of CLI"
+        "--use-cli",
+        action="store_true",
+        help="Use the flowerpower CLI in a subprocess instead of the Python API",
+    )
+    parser.add_argument(
+        "--use-api",
+        action="store_true",
+        help="Use Python API (default; kept for backwards compatibility)",
     )
     parser.add_argument(
         "--scan",
@@ -107,47 +189,56 @@ def main():
         help="Scan filesystem (no flowerpower installation required)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
 
     try:
         if args.scan:
             pipelines = list_pipelines_filesystem(args.path)
 
             if args.format == "json":
-                print(json.dumps(pipelines, indent=2))
+                _write_json(pipelines)
             elif args.format == "simple":
-                for p in pipelines:
-                    print(p["name"])
+                _write_lines(p["name"] for p in pipelines)
             else:
-                print(f"\nPipelines in {args.path or Path.cwd()}:")
-                print("-" * 50)
-                for p in pipelines:
-                    status = "OK" if p["has_config"] else "MISSING CONFIG"
-                    print(f"  {p['name']:30} [{status}]")
-                print(f"\nTotal: {len(pipelines)} pipeline(s)")
-
-        elif args.use_api:
+                _write_lines(
+                    [
+                        f"\nPipelines in {args.path or Path.cwd()}:",
+                        "-" * 50,
+                        *(
+                            f"  {p['name']:30} "
+                            f"[{'OK' if p['has_config'] else 'MISSING CONFIG'}]"
+                            for p in pipelines
+                        ),
+                        f"\nTotal: {len(pipelines)} pipeline(s)",
+                    ]
+                )
+
+        elif not resolve_use_cli(args.use_cli):
             pipelines = list_pipelines_api(args.path)
 
             if args.format == "json":
-                print(json.dumps(pipelines, indent=2))
+                _write_json(pipelines)
             elif args.format == "simple":
-                for name in pipelines:
-                    print(name)
+                _write_lines(pipelines)
             else:
-                print(f"\nAvailable pipelines:")
-                print("-" * 30)
-                for name in pipelines:
-                    print(f"  {name}")
-                print(f"\nTotal: {len(pipelines)} pipeline(s)")
+                _write_lines(
+                    [
+                        "\nAvailable pipelines:",
+                        "-" * 30,
+                        *(f"  {name}" for name in pipelines),
+                        f"\nTotal: {len(pipelines)} pipeline(s)",
+                    ]
+                )
         else:
             list_pipelines_cli(args.path, args.format)
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error listing pipelines: {e}")
-        sys.exit(1)
     except Exception as e:
-        print(f"Error: {e}")
+        # Also covers subprocess.CalledProcessError from the --use-cli path
+        print(f"Error listing pipelines: {e}")
         sys.exit(1)
 
 
@@ -11,16 +11,58 @@ Examples:
     python run_pipeline.py data_process --final-vars '["output_a", "output_b"]'
 """
 
+from __future__ import annotations
+
 import argparse
-import json
-import subprocess
+import functools
 import sys
 from pathlib import Path
 
+from _common import load_project, resolve_project_dir, resolve_use_cli
+
+
+@functools.lru_cache(maxsize=64)
+def _dumps_final_vars(key: tuple) -> str:
+    import json
+
+    return json.dumps([value for _, value in key])
+
+
+def _encode_final_vars(final_vars: list) -> str:
+    """JSON-encode ``final_vars``, memoized for the repeated calls of a batch run.
+
+    Items are type-tagged in the cache key so 1, 1.0 and True stay distinct.
+    """
+    try:
+        return _dumps_final_vars(tuple((type(v), v) for v in final_vars))
+    except TypeError:
+        # Unhashable items; encode without caching
+        import json
+
+        return json.dumps(final_vars)
+
+
+def _is_set(value) -> bool:
+    return value is not None
+
+
+# CLI flags in argv order, with the test deciding whether a value is passed
+_CLI_OPTIONS = (
+    ("--base-dir", bool),
+    ("--inputs", bool),
+    ("--final-vars", bool),
+    ("--executor", bool),
+    ("--executor-max-workers", bool),
+    ("--max-retries", _is_set),
+    ("--retry-delay", _is_set),
+    ("--log-level", bool),
+    ("--run-config", bool),
+)
+
 
 def run_pipeline_cli(
     name: str,
-    base_dir: Path | None = None,
+    base_dir: Path | str | None = None,
     inputs: dict | None = None,
     final_vars: list[str] | None = None,
     executor: str | None = None,
@@ -44,41 +86,49 @@ def run_pipeline_cli(
         log_level: Logging level
         run_config: Path to RunConfig file or JSON string
     """
-    cmd = ["flowerpower", "pipeline", "run", name]
-
-    if base_dir:
-        cmd.extend(["--base-dir", str(base_dir)])
-
-    if inputs:
-        cmd.extend(["--inputs", json.dumps(inputs)])
-
-    if final_vars:
-        cmd.extend(["--final-vars", json.dumps(final_vars)])
-
-    if executor:
-        cmd.extend(["--executor", executor])
-
-    if max_workers:
-        cmd.extend(["--executor-max-workers", str(max_workers)])
-
-    if max_retries is not None:
-        cmd.extend(["--max-retries", str(max_retries)])
-
-    if retry_delay is not None:
-        cmd.extend(["--retry-delay", str(retry_delay)])
-
-    if log_level:
-        cmd.extend(["--log-level", log_level])
-
-    if run_config:
-        cmd.extend(["--run-config", run_config])
+    import errno
+    import json
+    import subprocess
+
+    values = (
+        base_dir,
+        json.dumps(inputs) if inputs else None,
+        _encode_final_vars(final_vars) if final_vars else None,
+        executor,
+        max_workers,
+        max_retries,
+        retry_delay,
+        log_level,
+        run_config,
+    )
+    cmd = [
+        "flowerpower",
+        "pipeline",
+        "run",
+        name,
+        *(
+            token
+            for (flag, include), value in zip(_CLI_OPTIONS, values)
+            if include(value)
+            for token in (flag, str(value))
+        ),
+    ]
 
-    subprocess.run(cmd, check=True)
+    try:
+        subprocess.run(cmd, check=True)
+    except OSError as e:
+        if e.errno != errno.E2BIG:
+            raise
+        raise OSError(
+            e.errno,
+            "arguments are too long for the command line; "
+            "use the Python API (run without --use-cli) instead",
+        ) from e
 
 
 def run_pipeline_api(
     name: str,
-    base_dir: Path | None = None,
+    base_dir: Path | str | None = None,
     inputs: dict | None = None,
     final_vars: list[str] | None = None,
     executor: str | None = None,
@@ -103,9 +153,7 @@ def run_pipeline_api(
     Returns:
         Pipeline results
     """
-    from flowerpower import FlowerPowerProject
-
-    project = FlowerPowerProject.load(str(base_dir) if base_dir else ".")
+    project = load_project(resolve_project_dir(base_dir))
 
     # Build kwargs
     kwargs = {}
@@ -136,46 +184,96 @@ def run_pipeline_api(
     return project.run(name, **kwargs)
 
 
-def main():
+# Command line options as (flags, add_argument kwargs). Shared by the parser
+# and the bare `run_pipeline.py <name>` fast path so their defaults can't drift.
+_OPTIONS = (
+    (("--path", "-p"), {"help": "Path to FlowerPower project"}),
+    (("--inputs", "-i"), {"help": "Input parameters as JSON string"}),
+    (("--final-vars", "-o"), {"help": "Output variables as JSON list"}),
+    (
+        ("--executor", "-e"),
+        {
+            "choices": ["synchronous", "threadpool", "processpool", "ray", "dask"],
+            "help": "Executor type",
+        },
+    ),
+    (
+        ("--max-workers", "-w"),
+        {"type": int, "help": "Max workers for threadpool/processpool"},
+    ),
+    (("--max-retries",), {"type": int, "help": "Maximum retry attempts"}),
+    (
+        ("--retry-delay",),
+        {"type": float, "help": "Delay between retries in seconds"},
+    ),
+    (
+        ("--log-level", "-l"),
+        {
+            "choices": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            "help": "Logging level",
+        },
+    ),
+    (("--run-config",), {"help": "Path to RunConfig YAML file or JSON string"}),
+    (
+        ("--use-cli",),
+        {
+            "action": "store_true",
+            "help": "Use the flowerpower CLI in a subprocess instead of the Python API",
+        },
+    ),
+    (
+        ("--use-api",),
+        {
+            "action": "store_true",
+            "help": "Use Python API (default; kept for backwards compatibility)",
+        },
+    ),
+)
+
+# Option defaults, derived the way argparse does (dest from the long flag)
+_DEFAULTS = {
+    flags[0].lstrip("-").replace("-", "_"): kwargs.get(
+        "default", False if kwargs.get("action") == "store_true" else None
+    )
+    for flags, kwargs in _OPTIONS
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run a FlowerPower pipeline")
     parser.add_argument("name", help="Pipeline name")
-    parser.add_argument("--path", "-p", type=Path, help="Path to FlowerPower project")
-    parser.add_argument("--inputs", "-i", help="Input parameters as JSON string")
-    parser.add_argument("--final-vars", "-o", help="Output variables as JSON list")
-    parser.add_argument(
-        "--executor",
-        "-e",
-        choices=["synchronous", "threadpool", "processpool", "ray", "dask"],
-        help="Executor type",
-    )
-    parser.add_argument(
-        "--max-workers", "-w", type=int, help="Max workers for threadpool/processpool"
-    )
-    parser.add_argument("--max-retries", type=int, help="Maximum retry attempts")
-    parser.add_argument(
-        "--retry-delay", type=float, help="Delay between retries in seconds"
-    )
-    parser.add_argument(
-        "--log-level",
-        "-l",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Logging level",
-    )
-    parser.add_argument(
-        "--run-config", help="Path to RunConfig YAML file or JSON string"
-    )
-    parser.add_argument(
-        "--use-api", action="store_true", help="Use Python API instead of CLI"
-    )
+    for flags, kwargs in _OPTIONS:
+        parser.add_argument(*flags, **kwargs)
+
+    return parser
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments, bypassing argparse for a lone name."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        return argparse.Namespace(name=argv[0], **_DEFAULTS)
+    return _build_parser().parse_args(argv)
 
-    args = parser.parse_args()
+
+def main():
+    args = _parse_args()
 
     # Parse JSON arguments
-    inputs = json.loads(args.inputs) if args.inputs else None
-    final_vars = json.loads(args.final_vars) if args.final_vars else None
+    inputs = final_vars = None
+    if args.inputs or args.final_vars:
+        import json
+
+        if args.inputs:
+            inputs = json.loads(args.inputs)
+        if args.final_vars:
+            final_vars = json.loads(args.final_vars)
 
     try:
-        if args.use_api:
+        # --run-config is only understood by the CLI
+        if not resolve_use_cli(args.use_cli or bool(args.run_config)):
             result = run_pipeline_api(
                 args.name,
                 base_dir=args.path,
@@ -203,11 +301,9 @@ def main():
                 run_config=args.run_config,
             )
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error running pipeline: {e}")
-        sys.exit(1)
     except Exception as e:
-        print(f"Error: {e}")
+        # Also covers subprocess.CalledProcessError from the --use-cli path
+        print(f"Error running pipeline: {e}")
         sys.exit(1)
 
 